@@ -2,26 +2,73 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Optional, Tuple
 
-import matplotlib.pyplot as plt
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 FNG_API_URL = "https://api.alternative.me/fng/"
 COINGECKO_MARKET_CHART_URL = "https://api.coingecko.com/api/v3/coins/bitcoin/market_chart"
 LOOKBACK_DAYS = 183
+CHART_DPI = 110
+CHART_PNG_COMPRESS_LEVEL = 1
+ZONE_BOUNDS = (0, 20, 40, 60, 80, 100)
+ZONE_COLORS = ("#ff4d4f", "#ff9f43", "#ced4da", "#95de64", "#52c41a")
+ZONE_ALPHAS = (0.18, 0.15, 0.14, 0.14, 0.18)
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=3, backoff_factor=0.3)),
+)
+_DOTENV_LINE_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$",
+    re.M,
+)
+
+
+@dataclass
+class FearGreedSeries:
+    days: np.ndarray
+    values: np.ndarray
+    classifications: np.ndarray
+    timestamps: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def __getitem__(self, index: slice) -> FearGreedSeries:
+        return FearGreedSeries(
+            self.days[index],
+            self.values[index],
+            self.classifications[index],
+            self.timestamps[index],
+        )
 
 
 @dataclass
-class FearGreedPoint:
-    timestamp: datetime
-    value: int
-    classification: str
+class BtcPriceSeries:
+    days: np.ndarray
+    prices: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.days)
 
 
 def classify_zone(value: int) -> str:
@@ -39,81 +86,156 @@ def load_dotenv(dotenv_path: Path) -> None:
     if not dotenv_path.exists():
         return
 
-    for raw_line in dotenv_path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
+    for match in _DOTENV_LINE_RE.finditer(dotenv_path.read_text(encoding="utf-8")):
+        key, value = match.groups()
+        os.environ.setdefault(key, value.strip("'").strip('"'))
 
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip("'").strip('"')
-        os.environ.setdefault(key, value)
 
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-def fetch_fear_greed_history() -> List[FearGreedPoint]:
-    params = {"limit": 0, "format": "json"}
-    response = requests.get(FNG_API_URL, params=params, timeout=20)
+
+def _load_cached_rows(cache_path: Optional[Path]) -> list:
+    if cache_path is None or not cache_path.exists():
+        return []
+    try:
+        rows = _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return []
+    return rows if isinstance(rows, list) else []
+
+
+def _save_cached_rows(cache_path: Optional[Path], rows: list) -> None:
+    if cache_path is None:
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(rows), encoding="utf-8")
+
+
+def _days_since(timestamp_s: float) -> int:
+    return (datetime.now(tz=timezone.utc) - datetime.fromtimestamp(timestamp_s, tz=timezone.utc)).days
+
+
+def _lookback_cutoff(days: int, now: Optional[datetime] = None) -> datetime:
+    return (now or datetime.now(tz=timezone.utc)) - timedelta(days=days)
+
+
+def fetch_fear_greed_history(cache_path: Optional[Path] = None) -> FearGreedSeries:
+    cached_rows = _load_cached_rows(cache_path)
+    if cached_rows:
+        last_timestamp = max(int(row["timestamp"]) for row in cached_rows)
+        limit = max(1, _days_since(last_timestamp) + 2)
+    else:
+        limit = 0
+
+    params = {"limit": limit, "format": "json"}
+    response = _SESSION.get(FNG_API_URL, params=params, timeout=20)
     response.raise_for_status()
 
-    payload = response.json()
-    rows = payload.get("data", [])
-    points: List[FearGreedPoint] = []
-
-    for row in rows:
-        ts = datetime.fromtimestamp(int(row["timestamp"]), tz=timezone.utc)
-        points.append(
-            FearGreedPoint(
-                timestamp=ts,
-                value=int(row["value"]),
-                classification=row.get("value_classification", "Unknown"),
-            )
-        )
+    payload = _json_loads(response.content)
+    rows_by_timestamp = {int(row["timestamp"]): row for row in cached_rows}
+    rows_by_timestamp.update({int(row["timestamp"]): row for row in payload.get("data", [])})
+    rows = [rows_by_timestamp[ts] for ts in sorted(rows_by_timestamp)]
+    _save_cached_rows(cache_path, rows)
 
-    points.sort(key=lambda p: p.timestamp)
-    return points
+    timestamps = np.fromiter((int(row["timestamp"]) for row in rows), dtype=np.int64, count=len(rows)).astype(
+        "datetime64[s]"
+    )
+    return FearGreedSeries(
+        days=timestamps.astype("datetime64[D]"),
+        values=np.fromiter((int(row["value"]) for row in rows), dtype=np.int16, count=len(rows)),
+        classifications=np.array([row.get("value_classification", "Unknown") for row in rows], dtype=object),
+        timestamps=timestamps,
+    )
 
 
-def fetch_btc_price_history(days: int = LOOKBACK_DAYS) -> List[Tuple[datetime, float]]:
-    params = {"vs_currency": "usd", "days": str(days), "interval": "daily"}
-    response = requests.get(COINGECKO_MARKET_CHART_URL, params=params, timeout=20)
+def fetch_btc_price_history(
+    days: int = LOOKBACK_DAYS,
+    cache_path: Optional[Path] = None,
+) -> BtcPriceSeries:
+    now = datetime.now(tz=timezone.utc)
+    cutoff_ms = _lookback_cutoff(days, now).timestamp() * 1000
+    today_ms = datetime.combine(now.date(), datetime.min.time(), tzinfo=timezone.utc).timestamp() * 1000
+    cached_prices = [row for row in _load_cached_rows(cache_path) if cutoff_ms <= row[0] < today_ms]
+    request_days = days
+    if cached_prices:
+        last_timestamp_ms = max(row[0] for row in cached_prices)
+        request_days = min(days, _days_since(last_timestamp_ms / 1000) + 1)
+
+    params = {"vs_currency": "usd", "days": str(request_days), "interval": "daily"}
+    response = _SESSION.get(COINGECKO_MARKET_CHART_URL, params=params, timeout=20)
     response.raise_for_status()
 
-    payload = response.json()
-    prices = payload.get("prices", [])
-    points: List[Tuple[datetime, float]] = []
-    for timestamp_ms, price in prices:
-        dt = datetime.fromtimestamp(int(timestamp_ms) / 1000, tz=timezone.utc)
-        points.append((dt, float(price)))
+    payload = _json_loads(response.content)
+    prices = sorted(
+        (row for row in cached_prices + payload.get("prices", []) if row[0] >= cutoff_ms),
+        key=lambda row: row[0],
+    )
+    timestamps_ms = np.fromiter((int(row[0]) for row in prices), dtype=np.int64, count=len(prices))
+    days_array = timestamps_ms.astype("datetime64[ms]").astype("datetime64[D]")
+    last_of_day = np.r_[days_array[1:] != days_array[:-1], True] if prices else np.zeros(0, dtype=bool)
+    prices = [row for row, keep in zip(prices, last_of_day) if keep]
+    _save_cached_rows(cache_path, [row for row in prices if row[0] < today_ms])
+
+    return BtcPriceSeries(
+        days=days_array[last_of_day],
+        prices=np.fromiter((float(row[1]) for row in prices), dtype=np.float64, count=len(prices)),
+    )
 
-    points.sort(key=lambda p: p[0])
-    return points
 
+def filter_recent(series: FearGreedSeries, days: int = LOOKBACK_DAYS) -> FearGreedSeries:
+    cutoff = np.datetime64(int(_lookback_cutoff(days).timestamp()), "s")
+    start = np.searchsorted(series.timestamps, cutoff, side="left")
+    if start == len(series):
+        return series
+    return series[start:]
 
-def filter_recent(points: List[FearGreedPoint], days: int = LOOKBACK_DAYS) -> List[FearGreedPoint]:
-    if not points:
-        return []
-    cutoff = datetime.now(tz=timezone.utc) - timedelta(days=days)
-    recent = [point for point in points if point.timestamp >= cutoff]
-    return recent if recent else points
+
+def _chart_digest(series: FearGreedSeries, btc_prices: BtcPriceSeries) -> str:
+    digest = hashlib.blake2b()
+    digest.update(np.int64([CHART_DPI, CHART_PNG_COMPRESS_LEVEL]).tobytes())
+    for days, values in ((series.days, series.values), (btc_prices.days, btc_prices.prices)):
+        digest.update(np.int64(len(days)).tobytes())
+        digest.update(days.astype("datetime64[D]").astype(np.int64).tobytes())
+        digest.update(np.asarray(values, dtype=np.float64).tobytes())
+    return digest.hexdigest()
 
 
 def save_chart(
-    points: List[FearGreedPoint],
-    btc_prices: List[Tuple[datetime, float]],
+    series: FearGreedSeries,
+    btc_prices: BtcPriceSeries,
     output_path: Path,
 ) -> None:
-    dates = [point.timestamp for point in points]
-    values = [point.value for point in points]
-    btc_dates = [point[0] for point in btc_prices]
-    btc_values = [point[1] for point in btc_prices]
-
-    plt.style.use("seaborn-v0_8-whitegrid")
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.axhspan(0, 20, facecolor="#ff4d4f", alpha=0.18)
-    ax.axhspan(20, 40, facecolor="#ff9f43", alpha=0.15)
-    ax.axhspan(40, 60, facecolor="#ced4da", alpha=0.14)
-    ax.axhspan(60, 80, facecolor="#95de64", alpha=0.14)
-    ax.axhspan(80, 100, facecolor="#52c41a", alpha=0.18)
+    dates = series.days
+    values = series.values
+    btc_dates = btc_prices.days
+    btc_values = btc_prices.prices
+
+    digest = _chart_digest(series, btc_prices)
+    digest_path = output_path.with_suffix(output_path.suffix + ".sha")
+    if output_path.exists() and digest_path.exists() and digest_path.read_text(encoding="utf-8") == digest:
+        return
+
+    from matplotlib import style
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import PatchCollection
+    from matplotlib.colors import to_rgba
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Rectangle
+
+    style.use("seaborn-v0_8-whitegrid")
+    fig = Figure(figsize=(12, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    zone_bands = PatchCollection(
+        [Rectangle((0, low), 1, high - low) for low, high in zip(ZONE_BOUNDS[:-1], ZONE_BOUNDS[1:])],
+        facecolors=[to_rgba(color, alpha) for color, alpha in zip(ZONE_COLORS, ZONE_ALPHAS)],
+        edgecolors="none",
+        transform=ax.get_yaxis_transform(),
+    )
+    ax.add_collection(zone_bands, autolim=False)
     ax.plot(dates, values, linewidth=2, color="#1f77b4", label="Fear & Greed Index")
     ax.fill_between(dates, values, alpha=0.2, color="#1f77b4")
     ax.set_title("Crypto Fear & Greed Index (BTC) - Last 6 Months")
@@ -139,111 +261,105 @@ def save_chart(
     fig.tight_layout()
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150)
-    plt.close(fig)
+    fig.savefig(output_path, dpi=CHART_DPI, pil_kwargs={"compress_level": CHART_PNG_COMPRESS_LEVEL})
+    digest_path.write_text(digest, encoding="utf-8")
+
 
+def _build_daily_range(start: np.datetime64, end: np.datetime64) -> np.ndarray:
+    return np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1, dtype="datetime64[D]")
 
-def _build_daily_range(start: date, end: date) -> List[date]:
-    total_days = (end - start).days
-    return [start + timedelta(days=offset) for offset in range(total_days + 1)]
 
+def _forward_fill_by_day(series_days: np.ndarray, series_values: np.ndarray, days: np.ndarray) -> np.ndarray:
+    n = days.size
+    values = np.full(n, np.nan, dtype=np.float64)
+    if n == 0:
+        return values
 
-def _forward_fill_by_day(series: Dict[date, float], days: List[date]) -> Dict[date, float]:
-    filled: Dict[date, float] = {}
-    last_value: Optional[float] = None
+    offsets = (series_days - days[0]).astype(np.int64)
+    in_range = (offsets >= 0) & (offsets < n)
+    values[offsets[in_range]] = series_values[in_range]
 
-    for day in days:
-        if day in series:
-            last_value = series[day]
-        if last_value is not None:
-            filled[day] = last_value
+    last_seen = np.where(~np.isnan(values), np.arange(n), 0)
+    np.maximum.accumulate(last_seen, out=last_seen)
+    return values[last_seen]
 
-    return filled
 
+def _daily_returns(filled: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    prev = filled[:-1]
+    cur = filled[1:]
+    valid = (prev != 0) & np.isfinite(prev) & np.isfinite(cur)
+    returns = np.divide(cur - prev, prev, out=np.zeros_like(cur), where=valid)
+    return returns, valid
 
-def _daily_returns(series: Dict[date, float], days: List[date]) -> Dict[date, float]:
-    returns: Dict[date, float] = {}
-    for idx in range(1, len(days)):
-        prev_day = days[idx - 1]
-        day = days[idx]
-        prev_value = series.get(prev_day)
-        value = series.get(day)
-        if prev_value is None or value is None or prev_value == 0:
-            continue
-        returns[day] = (value - prev_value) / prev_value
-    return returns
 
+def _average_ranks(values: np.ndarray) -> Tuple[np.ndarray, bool]:
+    values = np.asarray(values, dtype=np.float64)
+    n = values.size
 
-def _average_ranks(values: List[float]) -> List[float]:
-    indexed = list(enumerate(values))
-    indexed.sort(key=lambda item: item[1])
+    order = np.argsort(values, kind="mergesort")
+    sorted_values = values[order]
 
-    ranks = [0.0] * len(values)
-    i = 0
-    while i < len(indexed):
-        j = i + 1
-        while j < len(indexed) and indexed[j][1] == indexed[i][1]:
-            j += 1
-        avg_rank = (i + 1 + j) / 2.0
-        for k in range(i, j):
-            original_index = indexed[k][0]
-            ranks[original_index] = avg_rank
-        i = j
+    run_starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    run_ends = np.r_[run_starts[1:], n]
+    run_ranks = (run_starts + 1 + run_ends) / 2.0
 
-    return ranks
+    ranks = np.empty(n, dtype=np.float64)
+    ranks[order] = np.repeat(run_ranks, run_ends - run_starts)
+    return ranks, run_starts.size != n
 
 
-def _pearson_correlation(xs: List[float], ys: List[float]) -> Optional[float]:
+def _pearson_correlation(xs: np.ndarray, ys: np.ndarray) -> Optional[float]:
     if len(xs) != len(ys) or len(xs) < 2:
         return None
 
-    n = len(xs)
-    mean_x = sum(xs) / n
-    mean_y = sum(ys) / n
-
-    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
-    var_x = sum((x - mean_x) ** 2 for x in xs)
-    var_y = sum((y - mean_y) ** 2 for y in ys)
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    x_centered = x - x.mean()
+    y_centered = y - y.mean()
 
-    if var_x == 0 or var_y == 0:
+    denom = np.sqrt(x_centered @ x_centered) * np.sqrt(y_centered @ y_centered)
+    if denom == 0:
         return None
 
-    return cov / (var_x ** 0.5 * var_y ** 0.5)
+    return float((x_centered @ y_centered) / denom)
+
+
+def _spearman_from_ranks(rank_xs: np.ndarray, rank_ys: np.ndarray, has_ties: bool) -> Optional[float]:
+    n = rank_xs.size
+    if not has_ties and n >= 2 and n == rank_ys.size:
+        d = rank_xs - rank_ys
+        return float(1.0 - 6.0 * (d @ d) / (n * (n * n - 1)))
+    return _pearson_correlation(rank_xs, rank_ys)
 
 
 def _prepare_aligned_daily_returns(
-    recent_points: List[FearGreedPoint],
-    btc_prices: List[Tuple[datetime, float]],
-) -> Optional[Tuple[List[float], List[float]]]:
+    recent_points: FearGreedSeries,
+    btc_prices: BtcPriceSeries,
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
     if len(recent_points) < 3 or len(btc_prices) < 3:
         return None
 
-    fng_by_day: Dict[date, float] = {point.timestamp.date(): float(point.value) for point in recent_points}
-    btc_by_day: Dict[date, float] = {timestamp.date(): price for timestamp, price in btc_prices}
-
-    overlap_days = sorted(set(fng_by_day.keys()) & set(btc_by_day.keys()))
-    if len(overlap_days) < 3:
+    overlap_days = np.intersect1d(recent_points.days, btc_prices.days)
+    if overlap_days.size < 3:
         return None
 
     day_range = _build_daily_range(overlap_days[0], overlap_days[-1])
-    fng_filled = _forward_fill_by_day(fng_by_day, day_range)
-    btc_filled = _forward_fill_by_day(btc_by_day, day_range)
+    fng_filled = _forward_fill_by_day(recent_points.days, recent_points.values, day_range)
+    btc_filled = _forward_fill_by_day(btc_prices.days, btc_prices.prices, day_range)
 
-    fng_returns = _daily_returns(fng_filled, day_range)
-    btc_returns = _daily_returns(btc_filled, day_range)
+    fng_returns, fng_valid = _daily_returns(fng_filled)
+    btc_returns, btc_valid = _daily_returns(btc_filled)
 
-    aligned_days = sorted(set(fng_returns.keys()) & set(btc_returns.keys()))
-    if len(aligned_days) < 3:
+    valid = fng_valid & btc_valid
+    if np.count_nonzero(valid) < 3:
         return None
 
-    fng_values = [fng_returns[day] for day in aligned_days]
-    btc_values = [btc_returns[day] for day in aligned_days]
-    return fng_values, btc_values
+    return fng_returns[valid], btc_returns[valid]
 
 
 def calculate_spearman_correlation(
-    recent_points: List[FearGreedPoint],
-    btc_prices: List[Tuple[datetime, float]],
+    recent_points: FearGreedSeries,
+    btc_prices: BtcPriceSeries,
 ) -> Optional[float]:
     aligned_returns = _prepare_aligned_daily_returns(recent_points, btc_prices)
     if aligned_returns is None:
@@ -251,9 +367,9 @@ def calculate_spearman_correlation(
 
     fng_values, btc_values = aligned_returns
 
-    rank_fng = _average_ranks(fng_values)
-    rank_btc = _average_ranks(btc_values)
-    return _pearson_correlation(rank_fng, rank_btc)
+    rank_fng, fng_has_ties = _average_ranks(fng_values)
+    rank_btc, btc_has_ties = _average_ranks(btc_values)
+    return _spearman_from_ranks(rank_fng, rank_btc, fng_has_ties or btc_has_ties)
 
 
 def describe_correlation(correlation: Optional[float]) -> str:
@@ -282,13 +398,14 @@ def describe_correlation(correlation: Optional[float]) -> str:
     return f"{correlation:.2f}（{strength}. {direction}）"
 
 def build_message(
-    latest: FearGreedPoint,
-    recent_points: List[FearGreedPoint],
+    recent_points: FearGreedSeries,
     spearman_text: str,
+    latest_idx: int = -1,
 ) -> str:
-    latest_zone = classify_zone(latest.value)
-    previous_value = recent_points[-2].value if len(recent_points) >= 2 else latest.value
-    delta = latest.value - previous_value
+    latest_value = int(recent_points.values[latest_idx])
+    latest_zone = classify_zone(latest_value)
+    previous_value = int(recent_points.values[latest_idx - 1]) if len(recent_points) >= 2 else latest_value
+    delta = latest_value - previous_value
     if delta > 0:
         delta_text = f"+{delta}"
     elif delta < 0:
@@ -296,11 +413,11 @@ def build_message(
     else:
         delta_text = "0"
 
-    latest_date = latest.timestamp.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    latest_date = recent_points.timestamps[latest_idx].item().strftime("%Y-%m-%d %H:%M UTC")
     return "\n".join(
         [
             "📊 BTC 市場情緒更新",
-            f"🧭 最新指數：{latest.value}（{latest_zone}）",
+            f"🧭 最新指數：{latest_value}（{latest_zone}）",
             f"🔁 與前次相比：{delta_text}",
             f"🕒 時間：{latest_date}",
             f"🔗 Spearman相關性：{spearman_text}",
@@ -309,7 +426,7 @@ def build_message(
 
 def send_telegram_message(bot_token: str, chat_id: str, text: str) -> None:
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-    response = requests.post(
+    response = _SESSION.post(
         url,
         data={"chat_id": chat_id, "text": text},
         timeout=20,
@@ -317,18 +434,21 @@ def send_telegram_message(bot_token: str, chat_id: str, text: str) -> None:
     response.raise_for_status()
 
 
-def send_telegram_photo(bot_token: str, chat_id: str, image_path: Path, caption: str) -> None:
+def _send_photo_bytes(bot_token: str, chat_id: str, image_bytes: bytes, caption: str) -> None:
     url = f"https://api.telegram.org/bot{bot_token}/sendPhoto"
-    with image_path.open("rb") as image_file:
-        response = requests.post(
-            url,
-            data={"chat_id": chat_id, "caption": caption},
-            files={"photo": image_file},
-            timeout=30,
-        )
+    response = _SESSION.post(
+        url,
+        data={"chat_id": chat_id, "caption": caption},
+        files={"photo": ("chart.png", image_bytes, "image/png")},
+        timeout=30,
+    )
     response.raise_for_status()
 
 
+def send_telegram_photo(bot_token: str, chat_id: str, image_path: Path, caption: str) -> None:
+    _send_photo_bytes(bot_token, chat_id, image_path.read_bytes(), caption)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Fetch BTC fear/greed data, generate chart, and send to Telegram.",
@@ -348,6 +468,11 @@ def parse_args() -> argparse.Namespace:
         default="output/fear_greed_last_6_months.png",
         help="Output chart path",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default="cache",
+        help="Directory for cached API responses",
+    )
     return parser.parse_args()
 
 
@@ -359,23 +484,33 @@ def main() -> None:
     if not args.bot_token or not args.chat_id:
         raise SystemExit("Please provide TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID.")
 
-    all_points = fetch_fear_greed_history()
+    cache_dir = Path(args.cache_dir)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fng_future = executor.submit(fetch_fear_greed_history, cache_path=cache_dir / "fng.json")
+        btc_future = executor.submit(fetch_btc_price_history, days=LOOKBACK_DAYS, cache_path=cache_dir / "btc.json")
+        all_points = fng_future.result()
+        btc_prices = btc_future.result()
+
     if not all_points:
         raise SystemExit("No fear & greed data available.")
 
     recent_points = filter_recent(all_points, days=LOOKBACK_DAYS)
-    btc_prices = fetch_btc_price_history(days=LOOKBACK_DAYS)
 
-    latest = all_points[-1]
     chart_path = Path(args.chart_path)
     save_chart(recent_points, btc_prices, chart_path)
 
     spearman_correlation = calculate_spearman_correlation(recent_points, btc_prices)
     spearman_text = describe_correlation(spearman_correlation)
 
-    message = build_message(latest, recent_points, spearman_text)
-    send_telegram_message(args.bot_token, args.chat_id, message)
-    send_telegram_photo(args.bot_token, args.chat_id, chart_path, "BTC fear/greed chart (last 6 months)")
+    message = build_message(recent_points, spearman_text)
+    image_bytes = chart_path.read_bytes()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        message_future = executor.submit(send_telegram_message, args.bot_token, args.chat_id, message)
+        photo_future = executor.submit(
+            _send_photo_bytes, args.bot_token, args.chat_id, image_bytes, "BTC fear/greed chart (last 6 months)"
+        )
+        message_future.result()
+        photo_future.result()
 
     print(message)
     print(f"Chart saved to: {chart_path.resolve()}")